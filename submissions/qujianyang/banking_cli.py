@@ -1,313 +1,396 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
 import sys
-import json
-from typing import Optional
-from banking_client import BankingClient, BankingConfig
+from decimal import Decimal
+from typing import Optional, TYPE_CHECKING
 import logging
+import orjson
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format='%(levelname)s: %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from banking_client import BankingClient
+
+DEFAULT_TOKEN_CACHE = os.path.join('~', '.cache', 'banking_cli', 'token.json')
+
+
+def _json_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError
+
+
+def _to_json(data) -> str:
+    """Serialize data as indented JSON"""
+    return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+
+
+def _write_lines(lines) -> None:
+    """Write a report to stdout in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _parse_amount(value) -> Decimal:
+    """argparse type for monetary amounts, checked exactly as the client will send them"""
+    # Only the transfer command takes an amount, and it loads the client anyway
+    from banking_client import parse_amount
+
+    try:
+        return parse_amount(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid amount {value!r}: {e}")
+
+
+def _parse_account_ids(value) -> list:
+    """argparse type for comma-separated account IDs, de-duplicated in first-seen order"""
+    account_ids = list(dict.fromkeys(account_id.strip() for account_id in value.split(',') if account_id.strip()))
+    if not account_ids:
+        raise argparse.ArgumentTypeError(f"no account IDs in {value!r}")
+    return account_ids
+
+
+def _create_parser():
+    """Build the CLI argument parser"""
+    parser = argparse.ArgumentParser(
+        description='Banking CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument('--url', default='http://localhost:8123', help='API URL')
+    parser.add_argument('--timeout', type=int, default=30, help='Timeout in seconds')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--json', action='store_true', help='JSON output')
+    parser.add_argument('--http2', action='store_true', help='Use HTTP/2 (requires httpx[http2])')
+    parser.add_argument(
+        '--http2-prior-knowledge',
+        action='store_true',
+        help='With --http2, speak h2c on http:// URLs (the server must support it)'
+    )
+    parser.add_argument(
+        '--no-token-cache',
+        action='store_true',
+        help=f'Always re-authenticate instead of reusing the JWT cached in {DEFAULT_TOKEN_CACHE}'
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+
+    # Transfer command
+    transfer_parser = subparsers.add_parser(
+        'transfer',
+        help='Transfer funds between accounts'
+    )
+    transfer_parser.add_argument(
+        '--from', '-f',
+        dest='from_account',
+        required=True,
+        help='Source account ID'
+    )
+    transfer_parser.add_argument(
+        '--to', '-t',
+        dest='to_account',
+        required=True,
+        help='Destination account ID'
+    )
+    transfer_parser.add_argument(
+        '--amount', '-a',
+        type=_parse_amount,
+        required=True,
+        help='Amount to transfer'
+    )
+    transfer_parser.add_argument(
+        '--auth',
+        action='store_true',
+        help='Use JWT authentication'
+    )
+    transfer_parser.add_argument(
+        '--username', '-u',
+        default='admin',
+        help='Username for authentication (default: admin)'
+    )
+    transfer_parser.add_argument(
+        '--password', '-p',
+        default='password',
+        help='Password for authentication (default: password)'
+    )
+    transfer_parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Validate accounts before transfer'
+    )
+
+    # Validate command
+    validate_parser = subparsers.add_parser(
+        'validate',
+        help='Validate an account'
+    )
+    validate_parser.add_argument(
+        '--account', '-a',
+        required=True,
+        help='Account ID to validate'
+    )
+
+    # Balance command
+    balance_parser = subparsers.add_parser(
+        'balance',
+        help='Get account balance'
+    )
+    balance_parser.add_argument(
+        '--account', '-a',
+        required=True,
+        help='Account ID to check'
+    )
+
+    # Bulk balances command
+    balances_parser = subparsers.add_parser(
+        'balances',
+        help='Get balances for several accounts'
+    )
+    balances_group = balances_parser.add_mutually_exclusive_group(required=True)
+    balances_group.add_argument(
+        '--accounts',
+        type=_parse_account_ids,
+        help='Comma-separated account IDs to check'
+    )
+    balances_group.add_argument(
+        '--all',
+        action='store_true',
+        help='Check every account'
+    )
+
+    # List accounts command
+    subparsers.add_parser(
+        'list-accounts',
+        help='List all accounts'
+    )
+
+    # Transaction history command
+    history_parser = subparsers.add_parser(
+        'history',
+        help='Get transaction history (requires authentication)'
+    )
+    history_parser.add_argument(
+        '--username', '-u',
+        default='admin',
+        help='Username for authentication (default: admin)'
+    )
+    history_parser.add_argument(
+        '--password', '-p',
+        default='password',
+        help='Password for authentication (default: password)'
+    )
+
+    # Demo command
+    subparsers.add_parser(
+        'demo',
+        help='Run interactive demo of all features'
+    )
+
+    return parser
+
+
+# Parser shape is fixed, so build it once at import time
+_PARSER = _create_parser()
+
 
 class BankingCLI:
 
     def __init__(self):
-        self.parser = self._create_parser()
+        self.parser = _PARSER
         self.client = None
 
-    def _create_parser(self):
-        parser = argparse.ArgumentParser(
-            description='Banking CLI',
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-
-        parser.add_argument('--url', default='http://localhost:8123', help='API URL')
-        parser.add_argument('--timeout', type=int, default=30, help='Timeout in seconds')
-        parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-        parser.add_argument('--json', action='store_true', help='JSON output')
-
-        subparsers = parser.add_subparsers(dest='command')
-
-        # Transfer command
-        transfer_parser = subparsers.add_parser(
-            'transfer',
-            help='Transfer funds between accounts'
-        )
-        transfer_parser.add_argument(
-            '--from', '-f',
-            dest='from_account',
-            required=True,
-            help='Source account ID'
-        )
-        transfer_parser.add_argument(
-            '--to', '-t',
-            dest='to_account',
-            required=True,
-            help='Destination account ID'
-        )
-        transfer_parser.add_argument(
-            '--amount', '-a',
-            type=float,
-            required=True,
-            help='Amount to transfer'
-        )
-        transfer_parser.add_argument(
-            '--auth',
-            action='store_true',
-            help='Use JWT authentication'
-        )
-        transfer_parser.add_argument(
-            '--username', '-u',
-            default='admin',
-            help='Username for authentication (default: admin)'
-        )
-        transfer_parser.add_argument(
-            '--password', '-p',
-            default='password',
-            help='Password for authentication (default: password)'
-        )
-        transfer_parser.add_argument(
-            '--validate',
-            action='store_true',
-            help='Validate accounts before transfer'
-        )
-
-        # Validate command
-        validate_parser = subparsers.add_parser(
-            'validate',
-            help='Validate an account'
-        )
-        validate_parser.add_argument(
-            '--account', '-a',
-            required=True,
-            help='Account ID to validate'
-        )
-
-        # Balance command
-        balance_parser = subparsers.add_parser(
-            'balance',
-            help='Get account balance'
-        )
-        balance_parser.add_argument(
-            '--account', '-a',
-            required=True,
-            help='Account ID to check'
-        )
-
-        # List accounts command
-        subparsers.add_parser(
-            'list-accounts',
-            help='List all accounts'
-        )
-
-        # Transaction history command
-        history_parser = subparsers.add_parser(
-            'history',
-            help='Get transaction history (requires authentication)'
-        )
-        history_parser.add_argument(
-            '--username', '-u',
-            default='admin',
-            help='Username for authentication (default: admin)'
-        )
-        history_parser.add_argument(
-            '--password', '-p',
-            default='password',
-            help='Password for authentication (default: password)'
-        )
-
-        # Demo command
-        subparsers.add_parser(
-            'demo',
-            help='Run interactive demo of all features'
-        )
-
-        return parser
-
-    def _init_client(self, args) -> BankingClient:
+    def _init_client(self, args) -> 'BankingClient':
         """Initialize banking client with configuration"""
-        if args.verbose:
-            logging.getLogger().setLevel(logging.INFO)
+        # Imported here so --help and argument errors skip loading requests
+        from banking_client import BankingClient, BankingConfig
 
         config = BankingConfig(
             base_url=args.url,
-            timeout=args.timeout
+            timeout=args.timeout,
+            use_http2=args.http2,
+            http2_prior_knowledge=args.http2_prior_knowledge,
+            token_cache_path=None if args.no_token_cache else os.path.expanduser(DEFAULT_TOKEN_CACHE)
         )
         return BankingClient(config)
 
     def _output(self, data: dict, args):
         """Output data in requested format"""
         if args.json:
-            print(json.dumps(data, indent=2))
+            print(_to_json(data))
         else:
             # Human-readable output
-            for key, value in data.items():
-                print(f"{key}: {value}")
+            _write_lines(f"{key}: {value}" for key, value in data.items())
+
+    def _has_token(self, client, args) -> bool:
+        """True if the client holds a live JWT or can restore one without logging in"""
+        return client.is_authenticated() or client.restore_cached_token(args.username, args.password)
 
-    def cmd_transfer(self, args):
+    def cmd_transfer(self, client, args):
         """Handle transfer command"""
-        client = self._init_client(args)
-
-        try:
-            # Authenticate if requested
-            if args.auth:
-                if not args.verbose:
-                    print(f"Authenticating as {args.username}...")
-                if not client.authenticate(args.username, args.password):
-                    print("❌ Authentication failed")
-                    return 1
-                if not args.verbose:
-                    print("✓ Authentication successful")
-
-            # Perform transfer
+        # Authenticate if requested (and no live or cached token is available)
+        if args.auth and not self._has_token(client, args):
             if not args.verbose:
-                print(f"Transferring ${args.amount:.2f} from {args.from_account} to {args.to_account}...")
-
-            result = client.transfer_funds(
-                args.from_account,
-                args.to_account,
-                args.amount,
-                validate_accounts=args.validate
-            )
-
-            if result and result.status == "SUCCESS":
-                output_data = {
-                    "status": "SUCCESS",
-                    "transaction_id": result.transaction_id,
-                    "from_account": result.from_account,
-                    "to_account": result.to_account,
-                    "amount": result.amount,
-                    "message": result.message
-                }
-
-                if not args.json:
-                    print(f"✓ Transfer successful!")
-                    print(f"  Transaction ID: {result.transaction_id}")
-                    print(f"  From: {result.from_account}")
-                    print(f"  To: {result.to_account}")
-                    print(f"  Amount: ${result.amount:.2f}")
-                else:
-                    self._output(output_data, args)
-                return 0
-            else:
-                print("❌ Transfer failed")
-                if result:
-                    print(f"  Message: {result.message}")
+                print(f"Authenticating as {args.username}...")
+            if not client.authenticate(args.username, args.password, use_cache=False):
+                print("❌ Authentication failed")
                 return 1
+            if not args.verbose:
+                print("✓ Authentication successful")
 
-        finally:
-            client.close()
-
-    def cmd_validate(self, args):
-        """Handle validate command"""
-        client = self._init_client(args)
+        # Perform transfer
+        if not args.verbose:
+            print(f"Transferring ${args.amount:.2f} from {args.from_account} to {args.to_account}...")
 
-        try:
-            is_valid = client.validate_account(args.account)
+        result = client.transfer_funds(
+            args.from_account,
+            args.to_account,
+            args.amount,
+            validate_accounts=args.validate
+        )
 
+        if result and result.status == "SUCCESS":
             output_data = {
-                "account": args.account,
-                "is_valid": is_valid,
-                "status": "VALID" if is_valid else "INVALID"
+                "status": "SUCCESS",
+                "transaction_id": result.transaction_id,
+                "from_account": result.from_account,
+                "to_account": result.to_account,
+                "amount": result.amount,
+                "message": result.message
             }
 
             if not args.json:
-                status_icon = "✓" if is_valid else "❌"
-                print(f"{status_icon} Account {args.account} is {'VALID' if is_valid else 'INVALID'}")
+                print(f"✓ Transfer successful!")
+                print(f"  Transaction ID: {result.transaction_id}")
+                print(f"  From: {result.from_account}")
+                print(f"  To: {result.to_account}")
+                print(f"  Amount: ${result.amount:.2f}")
             else:
                 self._output(output_data, args)
+            return 0
+        else:
+            print("❌ Transfer failed")
+            if result:
+                print(f"  Message: {result.message}")
+            return 1
 
-            return 0 if is_valid else 1
+    def cmd_validate(self, client, args):
+        """Handle validate command"""
+        is_valid = client.validate_account(args.account)
 
-        finally:
-            client.close()
+        output_data = {
+            "account": args.account,
+            "is_valid": is_valid,
+            "status": "VALID" if is_valid else "INVALID"
+        }
 
-    def cmd_balance(self, args):
-        """Handle balance command"""
-        client = self._init_client(args)
+        if not args.json:
+            status_icon = "✓" if is_valid else "❌"
+            print(f"{status_icon} Account {args.account} is {'VALID' if is_valid else 'INVALID'}")
+        else:
+            self._output(output_data, args)
 
-        try:
-            balance = client.get_account_balance(args.account)
+        return 0 if is_valid else 1
 
-            if balance is not None:
-                output_data = {
-                    "account": args.account,
-                    "balance": balance
-                }
+    def cmd_balance(self, client, args):
+        """Handle balance command"""
+        balance = client.get_account_balance(args.account)
 
-                if not args.json:
-                    print(f"Account {args.account} balance: ${balance:.2f}")
-                else:
-                    self._output(output_data, args)
-                return 0
+        if balance is not None:
+            output_data = {
+                "account": args.account,
+                "balance": balance
+            }
+
+            if not args.json:
+                print(f"Account {args.account} balance: ${balance:.2f}")
             else:
-                print(f"❌ Could not retrieve balance for {args.account}")
+                self._output(output_data, args)
+            return 0
+        else:
+            print(f"❌ Could not retrieve balance for {args.account}")
+            return 1
+
+    def cmd_balances(self, client, args):
+        """Handle balances command"""
+        if args.all:
+            accounts = client.get_all_accounts()
+            if accounts is None:
+                print("❌ Could not retrieve accounts")
+                return 1
+            account_ids = [acc['accountId'] for acc in accounts if acc.get('accountId')]
+            if not account_ids:
+                print("❌ No accounts found")
                 return 1
+        else:
+            account_ids = args.accounts
 
-        finally:
-            client.close()
+        balances = client.get_balances_bulk(account_ids)
 
-    def cmd_list_accounts(self, args):
-        """Handle list-accounts command"""
-        client = self._init_client(args)
+        if args.json:
+            print(_to_json(balances))
+        else:
+            lines = [f"Balances for {len(balances)} accounts:", "-" * 60]
+            for account_id in account_ids:
+                balance = balances.get(account_id)
+                if balance is not None:
+                    lines.append(f"  {account_id}: ${balance:.2f}")
+                else:
+                    lines.append(f"  {account_id}: ❌ unavailable")
+            _write_lines(lines)
 
-        try:
-            accounts = client.get_all_accounts()
+        return 0 if all(balance is not None for balance in balances.values()) else 1
 
-            if accounts:
-                if args.json:
-                    print(json.dumps(accounts, indent=2))
-                else:
-                    print(f"Found {len(accounts)} accounts:")
-                    print("-" * 60)
-                    for acc in accounts:
-                        print(f"  {acc.get('accountId')}: {acc.get('accountType')} - {acc.get('status')}")
-                return 0
-            else:
-                print("❌ Could not retrieve accounts")
-                return 1
+    def cmd_list_accounts(self, client, args):
+        """Handle list-accounts command"""
+        accounts = client.get_all_accounts()
 
-        finally:
-            client.close()
+        if accounts:
+            if args.json:
+                print(_to_json(accounts))
+            else:
+                lines = [f"Found {len(accounts)} accounts:", "-" * 60]
+                lines.extend(
+                    f"  {acc.get('accountId')}: {acc.get('accountType')} - {acc.get('status')}"
+                    for acc in accounts
+                )
+                _write_lines(lines)
+            return 0
+        else:
+            print("❌ Could not retrieve accounts")
+            return 1
 
-    def cmd_history(self, args):
+    def cmd_history(self, client, args):
         """Handle history command"""
-        client = self._init_client(args)
-
-        try:
-            # Authenticate
+        # Authenticate unless a live or cached token is available
+        if not self._has_token(client, args):
             if not args.verbose:
                 print(f"Authenticating as {args.username}...")
 
-            if not client.authenticate(args.username, args.password):
+            if not client.authenticate(args.username, args.password, use_cache=False):
                 print("❌ Authentication failed")
                 return 1
 
-            # Get history
-            history = client.get_transaction_history()
+        # Get history
+        history = client.get_transaction_history()
 
-            if history:
-                if args.json:
-                    print(json.dumps(history, indent=2))
-                else:
-                    print(f"✓ Found {len(history)} transactions:")
-                    print("-" * 60)
-                    for txn in history[:10]:  # Show first 10
-                        print(f"  {txn.get('transactionId')}: ${txn.get('amount', 0):.2f}")
-                return 0
+        if history:
+            if args.json:
+                print(_to_json(history))
             else:
-                print("❌ Could not retrieve transaction history")
-                return 1
-
-        finally:
-            client.close()
+                lines = [f"✓ Found {len(history)} transactions:", "-" * 60]
+                lines.extend(
+                    f"  {txn.get('transactionId')}: ${txn.get('amount', 0):.2f}"
+                    for txn in history[:10]  # Show first 10
+                )
+                _write_lines(lines)
+            return 0
+        else:
+            print("❌ Could not retrieve transaction history")
+            return 1
 
-    def cmd_demo(self, args):
+    def cmd_demo(self, client, args):
         """Run interactive demo"""
         from banking_client import main as demo_main
         demo_main()
@@ -317,6 +400,14 @@ class BankingCLI:
         """Run the CLI"""
         args = self.parser.parse_args(argv)
 
+        logging.basicConfig(
+            level=logging.INFO if args.verbose else logging.WARNING,
+            format='%(levelname)s: %(message)s'
+        )
+        if not args.verbose:
+            # urllib3 logs a warning per transport retry; the command reports the final error
+            logging.getLogger('urllib3').setLevel(logging.ERROR)
+
         if not args.command:
             self.parser.print_help()
             return 0
@@ -324,8 +415,13 @@ class BankingCLI:
         # Dispatch to command handler
         command_method = getattr(self, f'cmd_{args.command.replace("-", "_")}', None)
         if command_method:
+            self.client = None
             try:
-                return command_method(args)
+                # One client (and keep-alive session) shared by the whole run;
+                # demo builds its own
+                if args.command != 'demo':
+                    self.client = self._init_client(args)
+                return command_method(self.client, args)
             except KeyboardInterrupt:
                 print("\n\nOperation cancelled by user")
                 return 130
@@ -333,6 +429,9 @@ class BankingCLI:
                 logger.exception("Command failed")
                 print(f"❌ Error: {str(e)}")
                 return 1
+            finally:
+                if self.client is not None:
+                    self.client.close()
         else:
             print(f"Unknown command: {args.command}")
             return 1
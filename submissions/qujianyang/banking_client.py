@@ -3,49 +3,77 @@ Modern Banking Client - Upgraded from Python 2.7 to 3.x
 """
 
 import logging
+import os
+import tempfile
+import threading
+import time
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
+from decimal import Context, Decimal, Inexact, InvalidOperation
+import orjson
+from cachetools import TTLCache
 import requests
-from requests.exceptions import RequestException, HTTPError, Timeout
-import json
-import time
-from functools import wraps
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException, HTTPError, JSONDecodeError, Timeout
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
 
 from config import BankingConfig
 
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-def retry_with_exponential_backoff(max_retries=3, initial_delay=1.0, backoff_factor=2.0, exceptions=(RequestException, Timeout)):
-    """Retry decorator with exponential backoff"""
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = initial_delay
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    if attempt < max_retries:
-                        logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay:.1f}s...")
-                        time.sleep(delay)
-                        delay *= backoff_factor
-                    else:
-                        raise
-        return wrapper
-    return decorator
-
-
-@dataclass
+# Monetary amounts are sent to the API as strings quantized to cents.
+# Inexact is trapped so sub-cent amounts are rejected rather than rounded.
+TWO_PLACES = Decimal('0.01')
+_DECIMAL_CONTEXT = Context(prec=20, traps=[InvalidOperation, Inexact])
+
+
+def _json(response):
+    """Decode a JSON response body with orjson
+
+    Decode errors are raised as requests' JSONDecodeError, a RequestException,
+    as response.json() would, so callers handle them with other request failures.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+def parse_amount(value):
+    """Convert a user-supplied amount to a positive, cent-quantized Decimal
+
+    Raises ValueError, with a message saying why, for anything that is not
+    a finite positive number with at most 2 decimal places.
+    """
+    try:
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+    except InvalidOperation:
+        raise ValueError("Amount must be a number.") from None
+    if not value.is_finite():
+        raise ValueError("Amount must be a number.")
+    if value <= 0:
+        raise ValueError("Amount must be positive.")
+    try:
+        return value.quantize(TWO_PLACES, context=_DECIMAL_CONTEXT)
+    except Inexact:
+        raise ValueError("Amount must not have more than 2 decimal places.") from None
+    except InvalidOperation:
+        # Quantizing needs more digits than the context's precision allows
+        raise ValueError("Amount is too large.") from None
+
+
+@dataclass(slots=True, frozen=True)
 class TransferResult:
     transaction_id: Optional[str]
     status: str
     message: str
     from_account: str
     to_account: str
-    amount: float
+    amount: Decimal
 
     def __str__(self):
         return f"Transfer {self.status}: {self.amount} from {self.from_account} to {self.to_account} (ID: {self.transaction_id})"
@@ -55,41 +83,193 @@ class BankingClient:
 
     def __init__(self, config=None):
         self.config = config or BankingConfig()
+
+        # Endpoint URLs are fixed per client, so build them once
+        base_url = self.config.base_url
+        self._auth_url = base_url + '/authToken'
+        self._transfer_url = base_url + '/transfer'
+        self._accounts_url = base_url + '/accounts'
+        self._history_url = base_url + '/transactions/history'
+        self._validate_prefix = base_url + '/accounts/validate/'
+        self._balance_prefix = base_url + '/accounts/balance/'
+
+        self._httpx = None  # set when the optional HTTP/2 transport is in use
+        self._session_lock = threading.Lock()
         self.session = self._create_session()
         self.jwt_token = None
+        self._jwt_exp = 0.0  # epoch seconds after which jwt_token is treated as stale
+        self._cached_login = None  # (username, password) when jwt_token came from the disk cache
+
+        # Optional cache of validate_account results (off unless a TTL is set)
+        self._validate_cache = None
+        if self.config.validate_cache_ttl > 0:
+            self._validate_cache = TTLCache(maxsize=1024, ttl=self.config.validate_cache_ttl)
+        self._validate_cache_lock = threading.Lock()
+
+        # Shared pool for concurrent requests, created on first use (and again
+        # after close()); threads start lazily and are reused
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
         logger.info(f"Banking client initialized for {self.config.base_url}")
 
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix='banking-client'
+                )
+            return self._executor
+
     def _create_session(self):
+        if self.config.use_http2:
+            return self._create_http2_session()
+
         session = requests.Session()
-        session.headers.update({'Content-Type': 'application/json', 'Accept': 'application/json'})
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
+        })
+
+        # Transport-level retries with jittered backoff for transient failures.
+        # Only idempotent methods are retried after a request may have reached
+        # the server; POST (transfer, auth) is retried on connect errors only.
+        retry = Retry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.backoff_factor,
+            backoff_jitter=self.config.backoff_jitter,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+        # Pooled adapter so repeat calls reuse the same TCP connection
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=False,
+            max_retries=retry
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         return session
 
-    def authenticate(self, username="admin", password="password"):
-        """Get JWT token"""
+    def _create_http2_session(self):
+        """httpx client that multiplexes concurrent requests over one HTTP/2 connection
+
+        Over https HTTP/2 is negotiated with ALPN. Plain http has no negotiation,
+        so it stays on HTTP/1.1 unless http2_prior_knowledge is set, in which
+        case HTTP/1.1 is disabled and h2c is spoken; the server must accept h2c.
+
+        Unlike the urllib3 Retry on the requests transport, httpx only retries
+        failed connects: there are no 502/503/504 status retries or backoff.
+        """
+        h2c = self.config.base_url.startswith('http://')
+        if h2c and not self.config.http2_prior_knowledge:
+            logger.warning(
+                "HTTP/2 needs an https URL; using HTTP/1.1 for %s "
+                "(set http2_prior_knowledge if the server accepts h2c)", self.config.base_url
+            )
+            h2c = False
         try:
-            url = f"{self.config.base_url}/authToken"
+            import httpx
+            import h2  # noqa: F401 -- httpx would only fail on the first request without it
+            transport = httpx.HTTPTransport(
+                http1=not h2c,
+                http2=True,
+                retries=self.config.max_retries,
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_maxsize,
+                    max_keepalive_connections=self.config.pool_connections
+                )
+            )
+        except ImportError as e:
+            raise ImportError("use_http2 requires httpx: pip install 'httpx[http2]'") from e
+
+        self._httpx = httpx
+        return httpx.Client(
+            base_url=self.config.base_url,
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'},
+            timeout=self.config.timeout,
+            transport=transport
+        )
+
+    def _send(self, method, url, **kwargs):
+        """Send a request, raising requests exceptions whichever transport is in use"""
+        if self._httpx is None:
+            response = method(url, timeout=self.config.timeout, **kwargs)
+            response.raise_for_status()
+            return response
+
+        httpx = self._httpx
+        try:
+            response = method(url, timeout=self.config.timeout, **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise HTTPError(str(e), response=e.response) from e
+        except httpx.TimeoutException as e:
+            raise Timeout(str(e)) from e
+        except httpx.RequestError as e:
+            raise RequestException(str(e)) from e
+
+    def _get_http2_session(self):
+        """The httpx client, rebuilt if close() shut it; requests sessions reopen on their own"""
+        with self._session_lock:
+            if self.session.is_closed:
+                self.session = self._create_http2_session()
+            return self.session
+
+    def _get(self, url, headers=None):
+        session = self.session if self._httpx is None else self._get_http2_session()
+        return self._send(session.get, url, headers=headers)
+
+    def _post(self, url, payload, headers=None):
+        body = orjson.dumps(payload)
+        if self._httpx is None:
+            return self._send(self.session.post, url, data=body, headers=headers)
+        return self._send(self._get_http2_session().post, url, content=body, headers=headers)
+
+    def restore_cached_token(self, username, password):
+        """Take the JWT for this API and user from the disk cache, if one is live; True if it was
+
+        The password is only kept to log in again if the server rejects the cached token.
+        """
+        cache_path = self.config.token_cache_path
+        if not cache_path or not self.load_cached_token(cache_path, username):
+            return False
+        logger.info(f"Reusing cached JWT token for user: {username}")
+        self._cached_login = (username, password)
+        return True
+
+    def authenticate(self, username="admin", password="password", use_cache=True):
+        """Get JWT token, from the disk cache unless use_cache is False"""
+        try:
+            url = self._auth_url
             payload = {
                 "username": username,
                 "password": password
             }
 
+            if use_cache and self.restore_cached_token(username, password):
+                return True
+
+            cache_path = self.config.token_cache_path
             logger.info(f"Authenticating user: {username}")
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.config.timeout
-            )
-            response.raise_for_status()
+            response = self._post(url, payload)
 
-            data = response.json()
-            self.jwt_token = data.get('token')
+            data = _json(response)
+            token = data.get('token')
 
-            if self.jwt_token:
-                # Add token to session headers
-                self.session.headers.update({
-                    'Authorization': f'Bearer {self.jwt_token}'
-                })
+            if token:
+                self._set_token(token, time.time() + self.config.token_ttl)
+                self._cached_login = None
                 logger.info("Authentication successful - JWT token acquired")
+                if cache_path:
+                    self.save_cached_token(cache_path, username)
                 return True
             else:
                 logger.error("Authentication response missing token")
@@ -102,22 +282,142 @@ class BankingClient:
             logger.error(f"Authentication request failed: {str(e)}")
             return False
 
+    def is_authenticated(self):
+        """True while a JWT is held and has not reached its expiry"""
+        return self.jwt_token is not None and time.time() < self._jwt_exp
+
+    def _set_token(self, token, expires_at):
+        self.jwt_token = token
+        self._jwt_exp = expires_at
+
+    def clear_token(self):
+        """Forget the JWT and every piece of per-login state kept with it"""
+        self.jwt_token = None
+        self._jwt_exp = 0.0
+        self._cached_login = None
+
+    def _auth_header(self):
+        """Authorization header for endpoints that need the JWT, or None without one"""
+        if not self.jwt_token:
+            return None
+        return {'Authorization': f'Bearer {self.jwt_token}'}
+
+    def _reauthenticate(self, error):
+        """Replace a cached JWT the server rejected with a fresh one; True if one was acquired"""
+        if self._cached_login is None or error.response is None:
+            return False
+        if error.response.status_code not in (401, 403):
+            return False
+
+        username, password = self._cached_login
+        logger.warning(f"Cached JWT token rejected ({error.response.status_code}); re-authenticating")
+        self.clear_token()
+        self._remove_cached_token(self.config.token_cache_path)
+        return self.authenticate(username, password)
+
+    def _send_with_jwt(self, request):
+        """Call request(), retrying once with a fresh JWT if a cached one is rejected"""
+        try:
+            return request()
+        except HTTPError as e:
+            if not self._reauthenticate(e):
+                raise
+        return request()
+
+    def load_cached_token(self, path, username):
+        """Restore an unexpired JWT for this API and user from disk
+
+        The password is not checked: the file already holds the bearer token, so a
+        verifier stored beside it would protect nothing. A revoked token is replaced
+        through the 401/403 re-authentication path.
+        """
+        try:
+            with open(path, 'rb') as f:
+                cached = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+
+        if not isinstance(cached, dict):
+            return False
+        if cached.get('base_url') != self.config.base_url or cached.get('username') != username:
+            return False
+        token, expires_at = cached.get('token'), cached.get('expires_at')
+        if not isinstance(token, str) or not token:
+            return False
+        if isinstance(expires_at, bool) or not isinstance(expires_at, (int, float)):
+            return False
+        if expires_at <= time.time():
+            # Nothing left worth keeping, so don't leave the token on disk
+            self._remove_cached_token(path)
+            return False
+
+        self._set_token(token, expires_at)
+        return True
+
+    @staticmethod
+    def _remove_cached_token(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def save_cached_token(self, path, username):
+        """Persist the current JWT so later processes can skip authentication"""
+        if not self.jwt_token:
+            return False
+
+        cached = {
+            'base_url': self.config.base_url,
+            'username': username,
+            'token': self.jwt_token,
+            'expires_at': self._jwt_exp
+        }
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            # Token is a credential: mkstemp creates the file private to the user,
+            # and replacing the old file swaps in new contents and mode atomically
+            fd, tmp_path = tempfile.mkstemp(dir=directory or None, prefix='.token-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson.dumps(cached))
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove_cached_token(tmp_path)
+                raise
+            return True
+        except OSError as e:
+            logger.warning(f"Could not cache JWT token: {str(e)}")
+            return False
+
     def validate_account(self, account_id):
+        if self._validate_cache is not None:
+            with self._validate_cache_lock:
+                cached = self._validate_cache.get(account_id)
+            if cached is not None:
+                return cached
+
         try:
-            url = f"{self.config.base_url}/accounts/validate/{account_id}"
-            logger.info(f"Validating account: {account_id}")
+            url = self._validate_prefix + str(account_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Validating account: {account_id}")
 
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
+            response = self._get(url)
 
-            data = response.json()
+            data = _json(response)
             is_valid = data.get('isValid', False)
 
             if is_valid:
-                logger.info(f"Account {account_id} is valid")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Account {account_id} is valid")
             else:
                 logger.warning(f"Account {account_id} is invalid")
 
+            if self._validate_cache is not None:
+                with self._validate_cache_lock:
+                    self._validate_cache[account_id] = is_valid
+
             return is_valid
 
         except HTTPError as e:
@@ -127,18 +427,25 @@ class BankingClient:
             logger.error(f"Account validation request failed: {str(e)}")
             return False
 
+    def invalidate_account(self, account_id):
+        """Drop a cached validation result so the next check hits the API"""
+        if self._validate_cache is not None:
+            with self._validate_cache_lock:
+                self._validate_cache.pop(account_id, None)
+
     def get_account_balance(self, account_id):
         try:
-            url = f"{self.config.base_url}/accounts/balance/{account_id}"
-            logger.info(f"Getting balance for account: {account_id}")
+            url = self._balance_prefix + str(account_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Getting balance for account: {account_id}")
 
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
+            response = self._get(url)
 
-            data = response.json()
+            data = _json(response)
             balance = data.get('balance')
 
-            logger.info(f"Account {account_id} balance: {balance}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Account {account_id} balance: {balance}")
             return balance
 
         except HTTPError as e:
@@ -148,46 +455,62 @@ class BankingClient:
             logger.error(f"Balance inquiry request failed: {str(e)}")
             return None
 
-    @retry_with_exponential_backoff(max_retries=3, initial_delay=1.0)
+    def get_balances_bulk(self, account_ids):
+        """Fetch balances for several accounts concurrently, keyed in input order"""
+        executor = self._get_executor()
+        futures = {
+            account_id: executor.submit(self.get_account_balance, account_id)
+            for account_id in account_ids
+        }
+        balances = {account_id: future.result() for account_id, future in futures.items()}
+
+        logger.info(f"Retrieved balances for {len(balances)} accounts")
+        return balances
+
     def transfer_funds(self, from_account, to_account, amount, validate_accounts=True):
         # Input validation
-        if amount <= 0:
-            logger.error(f"Invalid amount: {amount}. Amount must be positive.")
+        try:
+            amount = parse_amount(amount)
+        except ValueError as e:
+            logger.error(f"Invalid amount: {amount}. {e}")
             return None
 
         # Optional: Validate accounts before transfer (bonus feature)
         if validate_accounts:
-            if not self.validate_account(from_account):
+            # Both lookups are independent, so issue them concurrently
+            executor = self._get_executor()
+            from_future = executor.submit(self.validate_account, from_account)
+            to_future = executor.submit(self.validate_account, to_account)
+            from_valid, to_valid = from_future.result(), to_future.result()
+
+            if not from_valid:
                 logger.error(f"Source account {from_account} validation failed")
                 return None
-            if not self.validate_account(to_account):
+            if not to_valid:
                 logger.error(f"Destination account {to_account} validation failed")
                 return None
 
         try:
-            url = f"{self.config.base_url}/transfer"
+            url = self._transfer_url
 
             # Modern JSON payload construction (vs legacy string concatenation)
             payload = {
                 "fromAccount": from_account,
                 "toAccount": to_account,
-                "amount": amount
+                "amount": str(amount)
             }
 
-            logger.info(f"Initiating transfer: {amount} from {from_account} to {to_account}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Initiating transfer: {amount} from {from_account} to {to_account}")
 
-            # Modern requests library with proper timeout
-            response = self.session.post(
-                url,
-                json=payload,
-                timeout=self.config.timeout
+            # POST with configured timeout and HTTP error handling
+            # Headers are read per attempt, so a retry after re-authentication sends the new JWT
+            response = self._send_with_jwt(
+                lambda: self._post(url, payload, headers=self._auth_header())
             )
 
-            # Proper HTTP error handling
-            response.raise_for_status()
-
             # Structured JSON parsing
-            data = response.json()
+            data = _json(response)
 
             # Create result object using dataclass
             result = TransferResult(
@@ -199,7 +522,8 @@ class BankingClient:
                 amount=amount
             )
 
-            logger.info(f"Transfer successful: {result}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Transfer successful: {result}")
             return result
 
         except HTTPError as e:
@@ -207,7 +531,7 @@ class BankingClient:
 
             # Try to parse error response
             try:
-                error_data = e.response.json()
+                error_data = _json(e.response)
                 return TransferResult(
                     transaction_id=None,
                     status="FAILED",
@@ -216,7 +540,7 @@ class BankingClient:
                     to_account=to_account,
                     amount=amount
                 )
-            except json.JSONDecodeError:
+            except JSONDecodeError:
                 return None
 
         except Timeout:
@@ -233,13 +557,12 @@ class BankingClient:
             return None
 
         try:
-            url = f"{self.config.base_url}/transactions/history"
+            url = self._history_url
             logger.info("Fetching transaction history")
 
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
+            response = self._send_with_jwt(lambda: self._get(url, headers=self._auth_header()))
 
-            transactions = response.json()
+            transactions = _json(response)
             logger.info(f"Retrieved {len(transactions)} transactions")
             return transactions
 
@@ -252,13 +575,12 @@ class BankingClient:
 
     def get_all_accounts(self):
         try:
-            url = f"{self.config.base_url}/accounts"
+            url = self._accounts_url
             logger.info("Fetching all accounts")
 
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
+            response = self._get(url)
 
-            accounts = response.json()
+            accounts = _json(response)
             logger.info(f"Retrieved {len(accounts)} accounts")
             return accounts
 
@@ -270,6 +592,10 @@ class BankingClient:
             return None
 
     def close(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         self.session.close()
         logger.info("Banking client session closed")
 
@@ -356,4 +682,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     main()
@@ -5,10 +5,20 @@ Demonstrates modern configuration practices vs hardcoded values
 
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
-@dataclass
+# Environment variable -> BankingConfig field
+_ENV_FIELDS = {
+    'BANKING_API_URL': 'base_url',
+    'BANKING_API_TIMEOUT': 'timeout',
+    'BANKING_USERNAME': 'default_username',
+    'BANKING_PASSWORD': 'default_password',
+    'BANKING_LOG_LEVEL': 'log_level',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class BankingConfig:
     """
     Configuration class for banking client
@@ -28,6 +38,20 @@ class BankingConfig:
     # Connection settings
     max_retries: int = 3
     retry_delay: int = 1  # seconds
+    backoff_factor: float = 0.5  # seconds, doubled per retry
+    backoff_jitter: float = 0.5  # max random seconds added per retry
+    pool_connections: int = 10  # number of host pools to cache
+    pool_maxsize: int = 20  # keep-alive sockets per host
+    max_workers: int = 8  # threads for concurrent requests (keep <= pool_maxsize)
+    use_http2: bool = False  # multiplex over one connection (needs httpx[http2])
+    http2_prior_knowledge: bool = False  # speak h2c on http:// URLs (server must accept it)
+
+    # JWT reuse across processes (token_cache_path=None disables the disk cache)
+    token_ttl: int = 1800  # seconds
+    token_cache_path: Optional[str] = None
+
+    # Cache account validation results for this many seconds (0 disables)
+    validate_cache_ttl: int = 0
 
     # Logging level
     log_level: str = "INFO"
@@ -48,13 +72,11 @@ class BankingConfig:
         Returns:
             BankingConfig instance
         """
-        return cls(
-            base_url=os.getenv('BANKING_API_URL', cls.base_url),
-            timeout=int(os.getenv('BANKING_API_TIMEOUT', cls.timeout)),
-            default_username=os.getenv('BANKING_USERNAME', cls.default_username),
-            default_password=os.getenv('BANKING_PASSWORD', cls.default_password),
-            log_level=os.getenv('BANKING_LOG_LEVEL', cls.log_level)
-        )
+        env = os.environ
+        overrides: Dict[str, Any] = {field: env[var] for var, field in _ENV_FIELDS.items() if var in env}
+        if 'timeout' in overrides:
+            overrides['timeout'] = int(overrides['timeout'])
+        return cls(**overrides)
 
     def validate(self) -> bool:
         """
@@ -70,7 +92,3 @@ class BankingConfig:
         if self.max_retries < 0:
             return False
         return True
-
-
-# Default configuration instance
-default_config = BankingConfig()
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the banking client tests
+
+The modules under test are imported inside session fixtures rather than at
+module level, so collecting (or filtering out) the test files stays cheap.
+
+Under pytest-xdist (-n) each worker builds its own copy of every
+session-scoped fixture. That is fine here: the session templates are only
+read, and tests get per-test copies or monkeypatched attributes.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run integration tests against a live API server"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: requires a running banking API server")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect integration tests unless --run-integration is given"""
+    if config.getoption("--run-integration"):
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        (deselected if "integration" in item.keywords else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session")
+def banking_module():
+    """The banking_client module, imported on first use"""
+    import banking_client
+    return banking_client
+
+
+@pytest.fixture(scope="session")
+def requests_mod():
+    """The requests module, imported on first use"""
+    import requests
+    return requests
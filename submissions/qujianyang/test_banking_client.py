@@ -3,40 +3,136 @@ Unit Tests for Modern Banking Client
 Demonstrates modern testing practices (bonus points)
 """
 
+import copy
+import dataclasses
+import json
+import os
+import socket
+import sys
+import types
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from banking_client import BankingClient, TransferResult, BankingConfig
-import requests
+from decimal import Decimal
+from unittest.mock import Mock
 
 
-@pytest.fixture
-def mock_config():
-    """Fixture for test configuration"""
-    return BankingConfig(
+@pytest.fixture(scope="session")
+def _mock_config_template(banking_module):
+    """Test configuration, built once per session"""
+    return banking_module.BankingConfig(
         base_url="http://localhost:8123",
         timeout=10
     )
 
 
+@pytest.fixture(scope="session")
+def _client_template(banking_module, _mock_config_template):
+    """Banking client (and its session), built once per session"""
+    client = banking_module.BankingClient(_mock_config_template)
+    # Start the worker pool here so every copy shares it (and close() below
+    # shuts it down) instead of each copy lazily starting its own
+    client._get_executor()
+    yield client
+    client.close()
+
+
+def _patch_session(monkeypatch, client, name):
+    """Replace one method on the client's own session with a fresh mock"""
+    m = Mock()
+    # The session is shared with the client template, so undo the patch on teardown
+    monkeypatch.setattr(client.session, name, m)
+    return m
+
+
+@pytest.fixture
+def mock_post(monkeypatch, client):
+    """Mock for the client session's post"""
+    return _patch_session(monkeypatch, client, "post")
+
+
+@pytest.fixture
+def mock_get(monkeypatch, client):
+    """Mock for the client session's get"""
+    return _patch_session(monkeypatch, client, "get")
+
+
+@pytest.fixture(scope="session")
+def sample_transfer_result(banking_module):
+    """TransferResult shared by tests that only read it"""
+    return banking_module.TransferResult(
+        transaction_id='txn-789',
+        status='SUCCESS',
+        message='Completed',
+        from_account='ACC1000',
+        to_account='ACC1001',
+        amount=Decimal('150.00')
+    )
+
+
+@pytest.fixture(scope="session")
+def response_factory():
+    """Callable building stub HTTP responses"""
+    def make(status=200, body=None, raises=None):
+        # Tests never assert on the response itself, so a plain namespace
+        # is enough and much cheaper to build than a Mock
+        text = '' if body is None else json.dumps(body)
+        response = types.SimpleNamespace(status_code=status, text=text, content=text.encode())
+
+        def raise_for_status():
+            if raises is not None:
+                raise raises(response=response)
+
+        response.raise_for_status = raise_for_status
+        return response
+
+    return make
+
+
+@pytest.fixture
+def mock_config(_mock_config_template):
+    """Fixture for test configuration (frozen, so safe to share)"""
+    return _mock_config_template
+
+
+@pytest.fixture
+def client(_client_template):
+    """Fixture for banking client: a fresh shallow copy of the template
+
+    Copies share the template's session, worker pool and validation cache;
+    clear_token() resets the per-login state so no token leaks between tests.
+    """
+    client = copy.copy(_client_template)
+    client.clear_token()
+    return client
+
+
 @pytest.fixture
-def client(mock_config):
-    """Fixture for banking client"""
-    return BankingClient(mock_config)
+def make_client(banking_module):
+    """Callable building clients from a config; each one is closed on teardown"""
+    clients = []
+
+    def make(config=None):
+        client = banking_module.BankingClient(config)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
 
 
 class TestBankingClientInitialization:
     """Test client initialization"""
 
-    def test_client_creation_with_default_config(self):
+    def test_client_creation_with_default_config(self, make_client):
         """Test creating client with default configuration"""
-        client = BankingClient()
+        client = make_client()
         assert client.config is not None
         assert client.session is not None
         assert client.jwt_token is None
 
-    def test_client_creation_with_custom_config(self, mock_config):
+    def test_client_creation_with_custom_config(self, make_client, mock_config):
         """Test creating client with custom configuration"""
-        client = BankingClient(mock_config)
+        client = make_client(mock_config)
         assert client.config == mock_config
         assert client.config.timeout == 10
 
@@ -44,116 +140,271 @@ class TestBankingClientInitialization:
 class TestAuthentication:
     """Test JWT authentication"""
 
-    @patch('banking_client.requests.Session.post')
-    def test_successful_authentication(self, mock_post, client):
+    def test_successful_authentication(self, client, mock_post, response_factory):
         """Test successful JWT authentication"""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'token': 'test-jwt-token'}
-        mock_post.return_value = mock_response
+        mock_post.return_value = response_factory(200, {'token': 'test-jwt-token'})
 
         result = client.authenticate("alice", "password")
 
         assert result is True
         assert client.jwt_token == 'test-jwt-token'
-        assert 'Authorization' in client.session.headers
-        assert client.session.headers['Authorization'] == 'Bearer test-jwt-token'
+        assert client.is_authenticated() is True
+        assert client._auth_header() == {'Authorization': 'Bearer test-jwt-token'}
+        # Token is sent per request, not on every call through the session
+        assert 'Authorization' not in client.session.headers
 
-    @patch('banking_client.requests.Session.post')
-    def test_failed_authentication(self, mock_post, client):
+    def test_failed_authentication(self, client, mock_post, response_factory, requests_mod):
         """Test failed authentication"""
         # Mock failed response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status.side_effect = requests.HTTPError()
-        mock_post.return_value = mock_response
+        mock_post.return_value = response_factory(401, raises=requests_mod.HTTPError)
 
         result = client.authenticate("wrong", "credentials")
 
         assert result is False
         assert client.jwt_token is None
+        assert client.is_authenticated() is False
 
+    def test_cached_token_reused(self, make_client, tmp_path, response_factory, banking_module, requests_mod):
+        """Test a token cached on disk skips the auth request in a new client"""
+        config = banking_module.BankingConfig(token_cache_path=str(tmp_path / 'token.json'))
+        mock_post = Mock(return_value=response_factory(200, {'token': 'cached-jwt-token'}))
 
-class TestAccountValidation:
-    """Test account validation"""
-
-    @patch('banking_client.requests.Session.get')
-    def test_valid_account(self, mock_get, client):
-        """Test validating a valid account"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'accountId': 'ACC1000',
-            'isValid': True,
-            'status': 'ACTIVE'
-        }
-        mock_get.return_value = mock_response
-
-        result = client.validate_account('ACC1000')
-
-        assert result is True
-        mock_get.assert_called_once()
-
-    @patch('banking_client.requests.Session.get')
-    def test_invalid_account(self, mock_get, client):
-        """Test validating an invalid account"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'accountId': 'ACC2000',
-            'isValid': False,
-            'status': 'INVALID'
-        }
-        mock_get.return_value = mock_response
-
-        result = client.validate_account('ACC2000')
+        def new_client():
+            client = make_client(config)
+            client.session.post = mock_post
+            return client
 
-        assert result is False
+        assert new_client().authenticate("alice", "password") is True
 
+        client = new_client()
+        assert client.authenticate("alice", "password") is True
+        assert client.jwt_token == 'cached-jwt-token'
+        assert mock_post.call_count == 1
 
-class TestFundTransfer:
-    """Test fund transfer functionality (core requirement)"""
-
-    @patch('banking_client.requests.Session.post')
-    def test_successful_transfer(self, mock_post, client):
-        """Test successful fund transfer"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        # use_cache=False (--no-token-cache in the CLI) always logs in
+        mock_post.return_value = response_factory(401, raises=requests_mod.HTTPError)
+        client = new_client()
+        assert client.authenticate("alice", "wrong", use_cache=False) is False
+        assert client.jwt_token is None
+        assert mock_post.call_count == 2
+
+        # Tokens are cached per user
+        mock_post.return_value = response_factory(200, {'token': 'bob-jwt-token'})
+        assert new_client().authenticate("bob", "password") is True
+        assert mock_post.call_count == 3
+
+    def test_token_cache_file_private(self, make_client, tmp_path, banking_module):
+        """Test saving the token replaces a world-readable cache file with a private one"""
+        cache_path = tmp_path / 'token.json'
+        cache_path.write_bytes(b'{}')
+        cache_path.chmod(0o644)
+        client = make_client(banking_module.BankingConfig(token_cache_path=str(cache_path)))
+        client._set_token('jwt-token', 2 ** 40)
+
+        assert client.save_cached_token(str(cache_path), "alice") is True
+        assert cache_path.stat().st_mode & 0o777 == 0o600
+        assert os.listdir(tmp_path) == ['token.json']
+        assert client.load_cached_token(str(cache_path), "alice") is True
+
+    def test_expired_token_cache_removed(self, make_client, tmp_path, response_factory, banking_module, monkeypatch):
+        """Test an expired cache entry is deleted rather than left on disk"""
+        cache_path = tmp_path / 'token.json'
+        config = banking_module.BankingConfig(token_cache_path=str(cache_path))
+        client = make_client(config)
+        client.session.post = Mock(return_value=response_factory(200, {'token': 'old-jwt-token'}))
+        assert client.authenticate("alice", "password") is True
+
+        expired = client._jwt_exp + 1
+        monkeypatch.setattr(banking_module.time, 'time', lambda: expired)
+        client = make_client(config)
+        assert client.load_cached_token(str(cache_path), "alice") is False
+        assert not cache_path.exists()
+
+    @pytest.mark.parametrize("contents", [
+        b'[]',
+        b'{"base_url": "http://localhost:8123", "username": "alice", "token": "t", "expires_at": null}',
+        b'{"base_url": "http://localhost:8123", "username": "alice", "token": "t", "expires_at": "soon"}',
+        b'not json',
+    ], ids=["list", "null_expiry", "string_expiry", "not_json"])
+    def test_corrupt_token_cache_ignored(self, make_client, tmp_path, response_factory, banking_module, contents):
+        """Test an unreadable token cache falls back to a normal login"""
+        cache_path = tmp_path / 'token.json'
+        cache_path.write_bytes(contents)
+        client = make_client(banking_module.BankingConfig(token_cache_path=str(cache_path)))
+        client.session.post = Mock(return_value=response_factory(200, {'token': 'fresh-jwt-token'}))
+
+        assert client.authenticate("alice", "password") is True
+        assert client.jwt_token == 'fresh-jwt-token'
+        client.session.post.assert_called_once()
+
+    def test_rejected_cached_token_refreshed(self, make_client, tmp_path, response_factory, banking_module, requests_mod):
+        """Test a cached token the server rejects is dropped and replaced once"""
+        config = banking_module.BankingConfig(token_cache_path=str(tmp_path / 'token.json'))
+        client = make_client(config)
+        client.session.post = Mock(return_value=response_factory(200, {'token': 'revoked-jwt-token'}))
+        assert client.authenticate("alice", "password") is True
+
+        client = make_client(config)
+        client.session.post = Mock(return_value=response_factory(200, {'token': 'fresh-jwt-token'}))
+        client.session.get = Mock(side_effect=[
+            response_factory(401, raises=requests_mod.HTTPError),
+            response_factory(200, [{'transactionId': 'txn-1', 'amount': 100.0}]),
+        ])
+        assert client.authenticate("alice", "password") is True
+        client.session.post.assert_not_called()
+
+        assert client.get_transaction_history() == [{'transactionId': 'txn-1', 'amount': 100.0}]
+        client.session.post.assert_called_once()
+        assert client.session.get.call_args.kwargs['headers'] == {'Authorization': 'Bearer fresh-jwt-token'}
+
+        # The replacement is what later processes pick up
+        client = make_client(config)
+        assert client.authenticate("alice", "password") is True
+        assert client.jwt_token == 'fresh-jwt-token'
+
+
+# Validation, transfer and balance calls share one shape: mock a single HTTP
+# response, call the client method, compare the result. "raises" names a
+# requests exception so the module is only imported when the test runs.
+API_CASES = [
+    {
+        "method": "get",
+        "status_code": 200,
+        "json": {'accountId': 'ACC1000', 'isValid': True, 'status': 'ACTIVE'},
+        "raises": None,
+        "call": ("validate_account", 'ACC1000'),
+        "expected": True,
+    },
+    {
+        "method": "get",
+        "status_code": 200,
+        "json": {'accountId': 'ACC2000', 'isValid': False, 'status': 'INVALID'},
+        "raises": None,
+        "call": ("validate_account", 'ACC2000'),
+        "expected": False,
+    },
+    {
+        "method": "post",
+        "status_code": 200,
+        "json": {
             'transactionId': 'txn-123',
             'status': 'SUCCESS',
             'message': 'Transfer completed successfully',
             'fromAccount': 'ACC1000',
             'toAccount': 'ACC1001',
             'amount': 100.0
-        }
-        mock_post.return_value = mock_response
+        },
+        "raises": None,
+        "call": ("transfer_funds", 'ACC1000', 'ACC1001', 100.0, False),
+        "expected": {
+            'transaction_id': 'txn-123',
+            'status': 'SUCCESS',
+            'message': 'Transfer completed successfully',
+            'from_account': 'ACC1000',
+            'to_account': 'ACC1001',
+            'amount': Decimal('100.00')
+        },
+        "sent": {'fromAccount': 'ACC1000', 'toAccount': 'ACC1001', 'amount': '100.00'},
+    },
+    {
+        "method": "post",
+        "status_code": 400,
+        "json": {'message': 'Insufficient funds'},
+        "raises": "HTTPError",
+        "call": ("transfer_funds", 'ACC1000', 'ACC1001', 1000000.0, False),
+        "expected": {
+            'transaction_id': None,
+            'status': 'FAILED',
+            'message': 'Insufficient funds',
+            'from_account': 'ACC1000',
+            'to_account': 'ACC1001',
+            'amount': Decimal('1000000.00')
+        },
+    },
+    {
+        "method": "get",
+        "status_code": 200,
+        "json": {'accountId': 'ACC1000', 'balance': 5000.0},
+        "raises": None,
+        "call": ("get_account_balance", 'ACC1000'),
+        "expected": 5000.0,
+    },
+    {
+        "method": "get",
+        "status_code": 404,
+        "json": {'message': 'Account not found'},
+        "raises": "HTTPError",
+        "call": ("get_account_balance", 'ACC2000'),
+        "expected": None,
+    },
+]
+
+
+@pytest.mark.parametrize("case", API_CASES, ids=[
+    "valid_account",
+    "invalid_account",
+    "transfer_ok",
+    "transfer_http_err",
+    "balance_ok",
+    "balance_http_err",
+])
+def test_api_call(client, mock_post, mock_get, case, response_factory, requests_mod):
+    """Test a client call against a single mocked HTTP response"""
+    mock_http = mock_post if case["method"] == "post" else mock_get
+    raises = case["raises"] and getattr(requests_mod, case["raises"])
+    mock_http.return_value = response_factory(case["status_code"], case["json"], raises)
+
+    method_name, *call_args = case["call"]
+    result = getattr(client, method_name)(*call_args)
+
+    mock_http.assert_called_once()
+    expected = case["expected"]
+    if isinstance(expected, dict):
+        assert dataclasses.asdict(result) == expected
+        assert isinstance(result.amount, Decimal)
+    else:
+        assert result == expected
+    if "sent" in case:
+        assert json.loads(mock_http.call_args.kwargs['data']) == case["sent"]
+
+
+@pytest.mark.parametrize("method, call, expected", [
+    ("get", ("validate_account", 'ACC1000'), False),
+    ("get", ("get_account_balance", 'ACC1000'), None),
+    ("get", ("get_balances_bulk", ['ACC1000', 'ACC1001']), {'ACC1000': None, 'ACC1001': None}),
+    ("post", ("transfer_funds", 'ACC1000', 'ACC1001', 100.0, False), None),
+], ids=["validate", "balance", "balances_bulk", "transfer"])
+def test_non_json_body(client, mock_post, mock_get, response_factory, method, call, expected):
+    """Test a 200 response with a non-JSON body is handled as a failed request"""
+    response = response_factory(200)
+    response.content = b'<html><body>Bad Gateway</body></html>'
+    (mock_post if method == "post" else mock_get).return_value = response
+
+    method_name, *call_args = call
+    assert getattr(client, method_name)(*call_args) == expected
 
-        result = client.transfer_funds('ACC1000', 'ACC1001', 100.0, validate_accounts=False)
 
-        assert result is not None
-        assert isinstance(result, TransferResult)
-        assert result.transaction_id == 'txn-123'
-        assert result.status == 'SUCCESS'
-        assert result.amount == 100.0
-
-    @patch('banking_client.requests.Session.post')
-    def test_failed_transfer_http_error(self, mock_post, client):
-        """Test failed transfer due to HTTP error"""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = 'Insufficient funds'
-        mock_response.json.return_value = {
-            'message': 'Insufficient funds'
-        }
-        mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
-        mock_post.return_value = mock_response
+class TestAccountValidation:
+    """Test account validation"""
 
-        result = client.transfer_funds('ACC1000', 'ACC1001', 1000000.0, validate_accounts=False)
+    def test_validation_cache(self, make_client, response_factory, banking_module):
+        """Test cached validation results skip the API until invalidated"""
+        client = make_client(banking_module.BankingConfig(validate_cache_ttl=60))
+        mock_get = Mock(return_value=response_factory(200, {'accountId': 'ACC1000', 'isValid': True}))
+        client.session.get = mock_get
 
-        assert result is not None
-        assert result.status == 'FAILED'
+        assert client.validate_account('ACC1000') is True
+        assert client.validate_account('ACC1000') is True
+        assert mock_get.call_count == 1
+
+        client.invalidate_account('ACC1000')
+        assert client.validate_account('ACC1000') is True
+        assert mock_get.call_count == 2
+
+
+class TestFundTransfer:
+    """Test fund transfer functionality (core requirement)"""
 
     def test_invalid_amount(self, client):
         """Test transfer with invalid amount"""
@@ -161,73 +412,134 @@ class TestFundTransfer:
 
         assert result is None
 
-    @patch('banking_client.BankingClient.validate_account')
-    @patch('banking_client.requests.Session.post')
-    def test_transfer_with_validation(self, mock_post, mock_validate, client):
+    def test_sub_cent_amount_rejected(self, client, mock_post):
+        """Test an amount with more than 2 decimal places is rejected, not rounded"""
+        result = client.transfer_funds('ACC1000', 'ACC1001', 100.005, validate_accounts=False)
+
+        assert result is None
+        mock_post.assert_not_called()
+
+    @pytest.mark.parametrize("value, message", [
+        ('12.555', 'more than 2 decimal places'),
+        ('1e30', 'too large'),
+        ('abc', 'must be a number'),
+        ('inf', 'must be a number'),
+        ('0', 'must be positive'),
+    ], ids=["sub_cent", "overflow", "not_number", "infinite", "zero"])
+    def test_amount_rejection_reason(self, banking_module, value, message):
+        """Test each kind of invalid amount is rejected with its own reason"""
+        with pytest.raises(ValueError, match=message):
+            banking_module.parse_amount(value)
+
+    def test_transfer_with_validation(self, client, mock_post, monkeypatch, response_factory):
         """Test transfer with account validation"""
         # Mock validation
-        mock_validate.return_value = True
+        mock_validate = Mock(return_value=True)
+        monkeypatch.setattr(client, 'validate_account', mock_validate)
 
         # Mock successful transfer
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_post.return_value = response_factory(200, {
             'transactionId': 'txn-456',
             'status': 'SUCCESS',
             'message': 'Transfer completed',
             'fromAccount': 'ACC1000',
             'toAccount': 'ACC1001',
             'amount': 50.0
-        }
-        mock_post.return_value = mock_response
+        })
 
         result = client.transfer_funds('ACC1000', 'ACC1001', 50.0, validate_accounts=True)
 
-        assert result is not None
-        assert result.status == 'SUCCESS'
+        assert dataclasses.asdict(result) == {
+            'transaction_id': 'txn-456',
+            'status': 'SUCCESS',
+            'message': 'Transfer completed',
+            'from_account': 'ACC1000',
+            'to_account': 'ACC1001',
+            'amount': Decimal('50.00')
+        }
+        assert isinstance(result.amount, Decimal)
         assert mock_validate.call_count == 2  # Called for both accounts
 
+    def test_transfer_not_retried_on_read_timeout(self, banking_module):
+        """Test a transfer that times out waiting for a reply is sent only once"""
+        # Accepts connections but never answers, so every request hits the read timeout
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(8)
+        config = banking_module.BankingConfig(
+            base_url=f"http://127.0.0.1:{server.getsockname()[1]}",
+            timeout=0.2,
+            backoff_factor=0,
+            backoff_jitter=0
+        )
+        client = banking_module.BankingClient(config)
+
+        try:
+            result = client.transfer_funds('ACC1000', 'ACC1001', 10.0, validate_accounts=False)
+        finally:
+            client.close()
+
+        # Every attempt is still queued on the listening socket
+        received = b''
+        server.setblocking(False)
+        with server:
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except BlockingIOError:
+                    break
+                with conn:
+                    conn.settimeout(1)
+                    received += conn.recv(65536)
+
+        assert result is None
+        assert received.count(b'POST /transfer') == 1
+
+    def test_transfer_aborted_when_validation_fails(self, client, mock_post, monkeypatch):
+        """Test transfer is not sent when an account fails validation"""
+        mock_validate = Mock(side_effect=lambda account_id: account_id != 'ACC2000')
+        monkeypatch.setattr(client, 'validate_account', mock_validate)
+
+        result = client.transfer_funds('ACC1000', 'ACC2000', 50.0, validate_accounts=True)
+
+        assert result is None
+        assert mock_validate.call_count == 2
+        mock_post.assert_not_called()
+
 
 class TestAccountBalance:
     """Test account balance inquiry"""
 
-    @patch('banking_client.requests.Session.get')
-    def test_get_balance_success(self, mock_get, client):
-        """Test getting account balance"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'accountId': 'ACC1000',
-            'balance': 5000.0
-        }
-        mock_get.return_value = mock_response
+    def test_get_balances_bulk(self, client, monkeypatch):
+        """Test fetching several balances concurrently"""
+        mock_balance = Mock(side_effect={'ACC1000': 5000.0, 'ACC1001': 250.0, 'ACC2000': None}.get)
+        monkeypatch.setattr(client, 'get_account_balance', mock_balance)
 
-        balance = client.get_account_balance('ACC1000')
+        balances = client.get_balances_bulk(['ACC2000', 'ACC1000', 'ACC1001'])
 
-        assert balance == 5000.0
+        assert balances == {'ACC1000': 5000.0, 'ACC1001': 250.0, 'ACC2000': None}
+        assert list(balances) == ['ACC2000', 'ACC1000', 'ACC1001']
+        assert mock_balance.call_count == 3
 
 
 class TestTransactionHistory:
     """Test transaction history (bonus feature)"""
 
-    @patch('banking_client.requests.Session.get')
-    def test_get_history_with_token(self, mock_get, client):
+    def test_get_history_with_token(self, client, mock_get, response_factory):
         """Test getting transaction history with JWT token"""
         # Set JWT token
         client.jwt_token = 'test-token'
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_get.return_value = response_factory(200, [
             {'transactionId': 'txn-1', 'amount': 100.0},
             {'transactionId': 'txn-2', 'amount': 200.0}
-        ]
-        mock_get.return_value = mock_response
+        ])
 
         history = client.get_transaction_history()
 
         assert history is not None
         assert len(history) == 2
+        assert mock_get.call_args.kwargs['headers'] == {'Authorization': 'Bearer test-token'}
 
     def test_get_history_without_token(self, client):
         """Test getting history without authentication"""
@@ -243,42 +555,112 @@ class TestSessionManagement:
         """Test closing the client session"""
         mock_session = Mock()
         client.session = mock_session
+        mock_executor = Mock()
+        client._executor = mock_executor
 
         client.close()
 
         mock_session.close.assert_called_once()
+        mock_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    @pytest.mark.parametrize("use_http2", [False, True], ids=["requests", "httpx"])
+    def test_concurrent_calls_after_close(self, make_client, response_factory, banking_module, use_http2):
+        """Test a closed client still runs calls that use the worker pool"""
+        get_body = {'isValid': True, 'balance': 5000.0}
+        post_body = {'transactionId': 'txn-1', 'status': 'SUCCESS'}
+        if use_http2:
+            httpx = pytest.importorskip('httpx')
+            pytest.importorskip('h2')
+
+        client = make_client(banking_module.BankingConfig(use_http2=use_http2))
+        client.close()
+        if use_http2:
+            # close() shut the httpx client, so the next request builds a new one
+            def handler(request):
+                return httpx.Response(200, json=get_body if request.method == 'GET' else post_body)
+
+            client._create_http2_session = lambda: httpx.Client(
+                base_url=client.config.base_url, transport=httpx.MockTransport(handler)
+            )
+        else:
+            client.session.get = Mock(return_value=response_factory(200, get_body))
+            client.session.post = Mock(return_value=response_factory(200, post_body))
+
+        assert client.get_balances_bulk(['ACC1000', 'ACC1001']) == {'ACC1000': 5000.0, 'ACC1001': 5000.0}
+        assert client.transfer_funds('ACC1000', 'ACC1001', 10.0, validate_accounts=True).status == 'SUCCESS'
+
+    def test_http2_transport(self, make_client, banking_module, requests_mod):
+        """Test the optional HTTP/2 transport maps httpx errors to requests errors"""
+        httpx = pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+
+        def handler(request):
+            if request.url.path == '/accounts/balance/ACC1000':
+                return httpx.Response(200, json={'accountId': 'ACC1000', 'balance': 5000.0})
+            return httpx.Response(404, json={'message': 'Not found'})
+
+        client = make_client(banking_module.BankingConfig(use_http2=True))
+        assert isinstance(client.session, httpx.Client)
+
+        client.session.close()
+        client.session = httpx.Client(base_url=client.config.base_url, transport=httpx.MockTransport(handler))
+        assert client.get_account_balance('ACC1000') == 5000.0
+        assert client.get_account_balance('ACC2000') is None
+        with pytest.raises(requests_mod.HTTPError):
+            client._get(client._balance_prefix + 'ACC2000')
+
+    @pytest.mark.parametrize("prior_knowledge, opening", [
+        (False, b'GET /accounts/balance/ACC1000 HTTP/1.1'),
+        (True, b'PRI * HTTP/2.0'),
+    ], ids=["http1", "h2c"])
+    def test_http2_over_plain_http(self, banking_module, prior_knowledge, opening):
+        """Test --http2 on an http:// URL stays on HTTP/1.1 unless h2c is opted into"""
+        pytest.importorskip('httpx')
+        pytest.importorskip('h2')
+
+        # Never answers; only the bytes the client opens with matter
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        config = banking_module.BankingConfig(
+            base_url=f"http://127.0.0.1:{server.getsockname()[1]}",
+            timeout=0.2,
+            use_http2=True,
+            http2_prior_knowledge=prior_knowledge
+        )
+        client = banking_module.BankingClient(config)
+
+        try:
+            assert client.get_account_balance('ACC1000') is None
+        finally:
+            client.close()
+
+        with server:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(1)
+                preface = conn.recv(65536)
+
+        assert preface.startswith(opening)
 
 
 class TestTransferResult:
     """Test TransferResult dataclass"""
 
-    def test_transfer_result_creation(self):
+    def test_transfer_result_creation(self, sample_transfer_result):
         """Test creating a TransferResult"""
-        result = TransferResult(
-            transaction_id='txn-789',
-            status='SUCCESS',
-            message='Completed',
-            from_account='ACC1000',
-            to_account='ACC1001',
-            amount=150.0
-        )
-
-        assert result.transaction_id == 'txn-789'
-        assert result.status == 'SUCCESS'
-        assert result.amount == 150.0
+        assert dataclasses.asdict(sample_transfer_result) == {
+            'transaction_id': 'txn-789',
+            'status': 'SUCCESS',
+            'message': 'Completed',
+            'from_account': 'ACC1000',
+            'to_account': 'ACC1001',
+            'amount': Decimal('150.00')
+        }
 
-    def test_transfer_result_string_representation(self):
+    def test_transfer_result_string_representation(self, sample_transfer_result):
         """Test TransferResult string representation"""
-        result = TransferResult(
-            transaction_id='txn-789',
-            status='SUCCESS',
-            message='Completed',
-            from_account='ACC1000',
-            to_account='ACC1001',
-            amount=150.0
-        )
-
-        str_repr = str(result)
+        str_repr = str(sample_transfer_result)
         assert 'SUCCESS' in str_repr
         assert '150.0' in str_repr
         assert 'ACC1000' in str_repr
@@ -287,41 +669,51 @@ class TestTransferResult:
 class TestConfiguration:
     """Test configuration management"""
 
-    def test_default_config(self):
+    def test_default_config(self, banking_module):
         """Test default configuration values"""
-        config = BankingConfig()
+        config = banking_module.BankingConfig()
 
         assert config.base_url == "http://localhost:8123"
         assert config.timeout == 30
         assert config.validate() is True
 
-    def test_config_validation(self):
+    def test_config_validation(self, banking_module):
         """Test configuration validation"""
-        valid_config = BankingConfig(base_url="http://test.com", timeout=10)
+        valid_config = banking_module.BankingConfig(base_url="http://test.com", timeout=10)
         assert valid_config.validate() is True
 
-        invalid_config = BankingConfig(base_url="", timeout=-1)
+        invalid_config = banking_module.BankingConfig(base_url="", timeout=-1)
         assert invalid_config.validate() is False
 
+    def test_config_from_environment(self, monkeypatch, banking_module):
+        """Test environment variables override defaults"""
+        monkeypatch.setenv('BANKING_API_URL', 'http://env-api:9000')
+        monkeypatch.setenv('BANKING_API_TIMEOUT', '5')
+        monkeypatch.delenv('BANKING_USERNAME', raising=False)
+
+        config = banking_module.BankingConfig.from_environment()
+
+        assert config.base_url == 'http://env-api:9000'
+        assert config.timeout == 5
+        assert config.default_username == 'admin'
+
 
-# Integration test marker (skip if API not available)
+# Integration tests are deselected unless pytest runs with --run-integration
 @pytest.mark.integration
 class TestIntegration:
     """Integration tests (requires running API server)"""
 
-    @pytest.mark.skip(reason="Requires live API server")
-    def test_real_transfer(self):
+    def test_real_transfer(self, make_client):
         """Test real transfer against live API"""
-        client = BankingClient()
+        client = make_client()
         result = client.transfer_funds('ACC1000', 'ACC1001', 10.0)
 
         assert result is not None
         assert result.status == 'SUCCESS'
 
-    @pytest.mark.skip(reason="Requires live API server")
-    def test_real_authentication(self):
+    def test_real_authentication(self, make_client):
         """Test real authentication against live API"""
-        client = BankingClient()
+        client = make_client()
         result = client.authenticate('alice', 'password')
 
         assert result is True
@@ -329,4 +721,9 @@ class TestIntegration:
 
 
 if __name__ == '__main__':
-    pytest.main([__file__, '-v', '--cov=banking_client', '--cov-report=term-missing'])
+    # Skip plugin autoloading and the .pytest_cache; xdist and pytest-cov are then
+    # loaded explicitly. Tests run in parallel across all cores.
+    os.environ.setdefault('PYTEST_DISABLE_PLUGIN_AUTOLOAD', '1')
+    args = [__file__, '-v', '-p', 'no:cacheprovider', '-p', 'xdist', '-p', 'pytest_cov', '-n', 'auto',
+            '--cov=banking_client', '--cov-report=term-missing']
+    sys.exit(pytest.main(args + sys.argv[1:]))